@@ -0,0 +1,119 @@
+"""
+Shared helpers for the protein model blueprints
+Amino acid tables, input validation, preprocessing and JSON handling
+"""
+
+import torch
+import numpy as np
+import logging
+import orjson
+from flask import current_app, request
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Exactly 50 standard amino acid characters
+VALID_RE = re.compile(r'\A[ACDEFGHIKLMNPQRSTVWY]{50}\Z')
+
+# Amino acid alphabet, in model index and BLOSUM62 row/column order
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+
+# Byte -> amino acid index translation table (unknown characters map to 0)
+AA_TRANSLATE = bytes(max(AMINO_ACIDS.find(chr(c)), 0) for c in range(256))
+
+# ASCII code -> amino acid index lookup table (-1 for non amino acid bytes)
+AA_IDX = np.full(256, -1, dtype=np.int8)
+AA_IDX[np.frombuffer(AMINO_ACIDS.encode('ascii'), dtype=np.uint8)] = np.arange(20, dtype=np.int8)
+
+# Per-thread preprocessing buffers, reused across requests
+_input_buffers = threading.local()
+
+def load_checkpoint(model_path):
+    """
+    Load a PyTorch checkpoint from disk
+    Returns the model, or the raw checkpoint/state dict if no model is stored
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+    
+    # Check if it's a state dict or a complete model
+    checkpoint = torch.load(model_path, map_location='cpu')
+    
+    if isinstance(checkpoint, dict) and 'state_dict' in checkpoint:
+        # It's a checkpoint with state_dict
+        model = checkpoint
+        logger.info("Loaded model checkpoint with state_dict")
+    elif isinstance(checkpoint, dict) and 'model' in checkpoint:
+        # It's a checkpoint with model
+        model = checkpoint['model']
+        if hasattr(model, 'eval'):
+            model.eval()
+    elif hasattr(checkpoint, 'eval'):
+        # It's a complete model
+        model = checkpoint
+        model.eval()
+    else:
+        # It's a state dict
+        model = checkpoint
+        logger.info("Loaded model state dictionary")
+    
+    return model
+
+def preprocess_protein_sequence(sequence):
+    """
+    Preprocess a validated, upper-cased protein sequence for model input
+    Convert amino acid sequence to numerical representation
+    
+    The returned tensor is a per-thread buffer that is overwritten by the
+    next call on the same thread
+    """
+    # Convert sequence to indices
+    indices = sequence.encode('ascii').translate(AA_TRANSLATE)
+    
+    # Write into this thread's reusable (1, N) tensor
+    tensor = getattr(_input_buffers, 'tensor', None)
+    if tensor is None or tensor.shape[1] != len(indices):
+        tensor = _input_buffers.tensor = torch.empty(1, len(indices), dtype=torch.long)
+    tensor.numpy()[0] = np.frombuffer(indices, dtype=np.uint8)
+    
+    return tensor
+
+def parse_json():
+    """Parse the request body as JSON, returning None if it is empty or invalid"""
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+
+def ojson(data, status=200):
+    """Serialize a response with orjson"""
+    return current_app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
+
+def parse_sequence_request():
+    """
+    Read and validate the protein sequence from the request body
+    Returns (sequence, None) with the upper-cased sequence, or (None, error_response)
+    """
+    data = parse_json()
+    
+    if not data or 'sequence' not in data:
+        return None, ojson({'error': 'Missing sequence parameter'}, 400)
+    
+    sequence = data['sequence']
+    
+    # Validate input
+    if not isinstance(sequence, str) or len(sequence) != 50:
+        return None, ojson({
+            'error': 'Sequence must be a string of exactly 50 characters'
+        }, 400)
+    
+    # Check for valid amino acids
+    sequence = sequence.upper()
+    if not VALID_RE.match(sequence):
+        return None, ojson({
+            'error': 'Sequence contains invalid amino acid characters'
+        }, 400)
+    
+    return sequence, None
@@ -0,0 +1,155 @@
+"""
+Sequence generation blueprint
+Serves the final_ckpt.pt model via the /generate endpoint
+"""
+
+import numpy as np
+import logging
+from flask import Blueprint
+import os
+
+from common import AA_IDX, AMINO_ACIDS, load_checkpoint, ojson, parse_sequence_request
+
+logger = logging.getLogger(__name__)
+
+generate_bp = Blueprint('generate', __name__)
+
+# Global variable to store the model
+model = None
+
+# Simplified BLOSUM62-like scoring matrix, indexed by AA_IDX
+# In practice, you would use the actual BLOSUM62 matrix
+BLOSUM = np.array([
+    [ 4,  0, -2, -1, -2,  0, -2, -1, -1, -1, -1, -2, -1, -1, -1,  1,  0,  0, -3, -2],  # A
+    [ 0,  9, -3, -4, -2, -3, -3, -1, -3, -1, -1, -3, -3, -3, -3, -1, -1, -1, -2, -2],  # C
+    [-2, -3,  6,  2, -3, -1, -1, -3, -1, -4, -3,  1, -1,  0, -2,  0, -1, -3, -4, -3],  # D
+    [-1, -4,  2,  5, -3, -2,  0, -3,  1, -3, -2,  0, -1,  2,  0,  0, -1, -2, -3, -2],  # E
+    [-2, -2, -3, -3,  6, -3, -1,  0, -3,  0,  0, -3, -4, -3, -3, -2, -2, -1,  1,  3],  # F
+    [ 0, -3, -1, -2, -3,  6, -2, -4, -2, -4, -3,  0, -2, -2, -2,  0, -2, -3, -2, -3],  # G
+    [-2, -3, -1,  0, -1, -2,  8, -3, -1, -3, -2,  1, -2,  0,  0, -1, -2, -3, -2,  2],  # H
+    [-1, -1, -3, -3,  0, -4, -3,  4, -3,  2,  1, -3, -3, -3, -3, -2, -1,  3, -3, -1],  # I
+    [-1, -3, -1,  1, -3, -2, -1, -3,  5, -2, -1,  0, -1,  1,  2,  0, -1, -2, -3, -2],  # K
+    [-1, -1, -4, -3,  0, -4, -3,  2, -2,  4,  2, -3, -3, -2, -2, -2, -1,  1, -2, -1],  # L
+    [-1, -1, -3, -2,  0, -3, -2,  1, -1,  2,  5, -2, -2,  0, -1, -1,  0,  1, -1, -1],  # M
+    [-2, -3,  1,  0, -3,  0,  1, -3,  0, -3, -2,  6, -2,  0,  0,  1,  0, -3, -4, -2],  # N
+    [-1, -3, -1, -1, -4, -2, -2, -3, -1, -3, -2, -2,  7, -1, -2, -1, -1, -2, -4, -3],  # P
+    [-1, -3,  0,  2, -3, -2,  0, -3,  1, -2,  0,  0, -1,  5,  1,  0, -1, -2, -2, -1],  # Q
+    [-1, -3, -2,  0, -3, -2,  0, -3,  2, -2, -1,  0, -2,  1,  5, -1, -1, -3, -3, -2],  # R
+    [ 1, -1,  0,  0, -2,  0, -1, -2,  0, -2, -1,  1, -1,  0, -1,  4,  1, -2, -3, -2],  # S
+    [ 0, -1, -1, -1, -2, -2, -2, -1, -1, -1,  0,  0, -1, -1, -1,  1,  5,  0, -2, -2],  # T
+    [ 0, -1, -3, -2, -1, -3, -3,  3, -2,  1,  1, -3, -2, -2, -3, -2,  0,  4, -3, -1],  # V
+    [-3, -2, -4, -3,  1, -2, -2, -3, -3, -2, -1, -4, -4, -2, -3, -3, -2, -3, 11,  2],  # W
+    [-2, -2, -3, -2,  3, -3,  2, -1, -2, -1, -1, -2, -3, -1, -2, -2, -2, -1,  2,  7],  # Y
+], dtype=np.int8)
+
+# Flat 400-entry view of BLOSUM, indexed by a * 20 + b
+BLOSUM_LUT = BLOSUM.reshape(400)
+
+# Mock sequence generation settings
+AA_ALPHABET = np.frombuffer(AMINO_ACIDS.encode('ascii'), dtype=np.uint8)
+MAX_MUTATIONS = 7
+rng = np.random.default_rng()
+
+def _reseed_rng():
+    """Give each forked worker (e.g. under gunicorn --preload) its own random stream"""
+    global rng
+    rng = np.random.default_rng()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_rng)
+
+def load_model():
+    """Load the PyTorch model for sequence generation"""
+    global model
+    try:
+        model_path = os.path.join(os.path.dirname(__file__), '..', 'final_ckpt.pt')
+        
+        model = load_checkpoint(model_path)
+        
+        logger.info(f"Model loaded successfully from {model_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to load model: {str(e)}")
+        return False
+
+def generate_sequence_batch(protein_sequence, num_sequences=100):
+    """
+    Generate mock similar sequences as a (num_sequences, length) uint8 array
+    In a real implementation, this would use the actual model
+    """
+    seq_len = len(protein_sequence)
+    base = np.frombuffer(protein_sequence.encode('ascii'), dtype=np.uint8)
+    batch = np.tile(base, (num_sequences, 1))
+    
+    # Randomly modify some positions (5-15% of positions)
+    num_mutations = rng.integers(2, MAX_MUTATIONS + 1, size=num_sequences)  # 2-7 mutations for 50-char sequence
+    positions = rng.random((num_sequences, seq_len)).argsort(axis=1)[:, :MAX_MUTATIONS]  # distinct per row
+    new_aa = AA_ALPHABET[rng.integers(0, len(AA_ALPHABET), size=(num_sequences, MAX_MUTATIONS))]
+    
+    # Unused mutation slots write back the original residue
+    active = np.arange(MAX_MUTATIONS) < num_mutations[:, None]
+    new_aa = np.where(active, new_aa, np.take_along_axis(batch, positions, axis=1))
+    np.put_along_axis(batch, positions, new_aa, axis=1)
+    
+    return batch
+
+def encode_residues(sequence):
+    """Convert an amino acid string to an array of BLOSUM indices"""
+    return AA_IDX[np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)]
+
+def blosum62_scores_from_indices(reference_idx, sequences_idx):
+    """
+    Calculate BLOSUM62 scores of a (N, L) index array against (L,) reference indices
+    Scores the whole batch with a single gather from the flat BLOSUM_LUT
+    """
+    pair_idx = reference_idx.astype(np.int16)[None, :] * 20 + sequences_idx
+    return BLOSUM_LUT[pair_idx].sum(axis=1) / len(reference_idx)  # average per residue
+
+@generate_bp.route('/generate', methods=['POST'])
+def generate_sequences():
+    """Generate similar protein sequences"""
+    try:
+        sequence, error = parse_sequence_request()
+        if error is not None:
+            return error
+        
+        if model is None:
+            return ojson({'error': 'Model not loaded'}, 500)
+        
+        # Generate 100 similar sequences
+        generated = generate_sequence_batch(sequence, 100)
+        
+        # Calculate BLOSUM62 scores for the last 20 residues
+        original_last20_idx = encode_residues(sequence[-20:])
+        scores = blosum62_scores_from_indices(original_last20_idx, AA_IDX[generated[:, -20:]])
+        
+        # Select the top 5 by score without sorting all candidates
+        top_k = min(5, len(scores))
+        top_idx = np.argpartition(-scores, top_k - 1)[:top_k]
+        top_idx = top_idx[np.argsort(-scores[top_idx])]
+        top_sequences = [
+            {'sequence': generated[i].tobytes().decode('ascii'), 'score': float(scores[i])}
+            for i in top_idx
+        ]
+        
+        return ojson({
+            'sequences': top_sequences,
+            'original_sequence': sequence,
+            'status': 'success'
+        })
+        
+    except Exception as e:
+        logger.error(f"Generation error: {str(e)}")
+        return ojson({'error': f'Generation failed: {str(e)}'}, 500)
+
+def model_info():
+    """Get model information"""
+    if model is None:
+        return {'model_loaded': False}
+    
+    return {
+        'model_type': type(model).__name__,
+        'model_loaded': True,
+        'device': 'cpu'
+    }
@@ -0,0 +1,350 @@
+"""
+SMILES prediction blueprint
+Serves the fusion_best.pt protein to SMILES model via the /predict endpoint
+"""
+
+import torch
+import logging
+from flask import Blueprint
+import inspect
+import os
+import queue
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from functools import lru_cache
+
+from common import load_checkpoint, ojson, parse_sequence_request, preprocess_protein_sequence
+
+logger = logging.getLogger(__name__)
+
+predict_bp = Blueprint('predict', __name__)
+
+# Global variable to store the model
+model = None
+
+# Use torch.compile (PyTorch 2.x) instead of TorchScript when TORCH_COMPILE=1
+TORCH_COMPILE = os.environ.get('TORCH_COMPILE', '0') == '1'
+
+# Apply dynamic INT8 quantization to Linear/LSTM layers when QUANTIZE=1
+QUANTIZE = os.environ.get('QUANTIZE', '0') == '1'
+
+# Serve the model with ONNX Runtime instead of PyTorch when ONNX=1
+ONNX = os.environ.get('ONNX', '0') == '1'
+
+# Micro-batching of concurrent predictions (MAX_BATCH_SIZE=1 or TORCH_COMPILE=1 disables batching)
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '16'))
+BATCH_WINDOW_MS = float(os.environ.get('BATCH_WINDOW_MS', '5'))
+PREDICT_TIMEOUT_S = 30
+
+# Placeholder SMILES returned until real model decoding is implemented
+MOCK_SMILES = [
+    'CC(C)CC1=CC=C(C=C1)C(C)C(=O)O',
+    'CC1=CC=C(C=C1)C2=CC(=O)C3=C(C=CC=C3O2)O',
+    'CC1=CC=C(C=C1)C2=CC(=O)C3=C(C=CC=C3O2)O',
+    'CC1=CC=C(C=C1)C2=CC(=O)C3=C(C=CC=C3O2)O',
+    'CC1=CC=C(C=C1)C2=CC(=O)C3=C(C=CC=C3O2)O'
+]
+
+_batch_queue = queue.Queue()
+_batching_supported = True
+_batch_thread = None
+_batch_thread_lock = threading.Lock()
+
+def load_model():
+    """Load the PyTorch model"""
+    global model, _batching_supported
+    try:
+        _predict_cached.cache_clear()
+        _batching_supported = True
+        model_path = os.path.join(os.path.dirname(__file__), '..', 'fusion_best.pt')
+        
+        model = load_checkpoint(model_path)
+        
+        if isinstance(model, torch.nn.Module) and ONNX:
+            model = export_onnx_model(model, 'fusion_best') or model
+        
+        if isinstance(model, torch.nn.Module) and QUANTIZE:
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            )
+            logger.info("Applied dynamic INT8 quantization")
+        
+        if isinstance(model, torch.nn.Module):
+            if TORCH_COMPILE and hasattr(torch, 'compile'):
+                model = torch.compile(model, mode='reduce-overhead')
+                logger.info("Compiled model with torch.compile")
+            else:
+                model = script_model(model)
+        
+        if callable(model):
+            warmup_model(model)
+        
+        logger.info(f"Model loaded successfully from {model_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to load model: {str(e)}")
+        return False
+
+class OnnxModel:
+    """Callable wrapper running an ONNX Runtime session on torch tensors"""
+    
+    def __init__(self, session):
+        self.session = session
+    
+    def __call__(self, input_tensor):
+        outputs = self.session.run(None, {'input': input_tensor.numpy()})
+        return torch.from_numpy(outputs[0])
+
+def export_onnx_model(module, name):
+    """
+    Export the model to ONNX (INT8-quantized when QUANTIZE=1) and load it
+    into an ONNX Runtime session; returns None to fall back to PyTorch
+    
+    The export goes to a per-process temporary directory, so concurrent
+    workers never race on the same files; it is removed once loaded
+    """
+    try:
+        import onnxruntime
+    except ImportError:
+        logger.warning("ONNX=1 but onnxruntime is not installed, using PyTorch model")
+        return None
+    
+    with tempfile.TemporaryDirectory(prefix=f"{name}-onnx-") as export_dir:
+        onnx_path = os.path.join(export_dir, f"{name}.onnx")
+        try:
+            export_kwargs = {}
+            if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+                # The TorchScript-based exporter only needs `onnx`, and its graphs
+                # quantize cleanly with onnxruntime.quantization
+                export_kwargs['dynamo'] = False
+            example_input = torch.zeros(1, 50, dtype=torch.long)
+            torch.onnx.export(
+                module, example_input, onnx_path, opset_version=17,
+                input_names=['input'], output_names=['output'],
+                dynamic_axes={'input': {0: 'batch'}, 'output': {0: 'batch'}},
+                **export_kwargs
+            )
+        except Exception as e:
+            logger.warning(f"ONNX export failed, using PyTorch model: {str(e)}")
+            return None
+        
+        quantized = False
+        if QUANTIZE:
+            try:
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+                int8_path = os.path.join(export_dir, f"{name}.int8.onnx")
+                quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+                onnx_path = int8_path
+                quantized = True
+            except Exception as e:
+                logger.warning(f"ONNX INT8 quantization failed, serving FP32 ONNX model: {str(e)}")
+        
+        try:
+            options = onnxruntime.SessionOptions()
+            if os.environ.get('ORT_THREADS'):
+                options.intra_op_num_threads = int(os.environ['ORT_THREADS'])
+            session = onnxruntime.InferenceSession(
+                onnx_path, options, providers=['CPUExecutionProvider']
+            )
+        except Exception as e:
+            logger.warning(f"ONNX Runtime session creation failed, using PyTorch model: {str(e)}")
+            return None
+    
+    logger.info(f"Serving model with ONNX Runtime{' (INT8)' if quantized else ''}")
+    return OnnxModel(session)
+
+def script_model(module):
+    """
+    Compile the model to TorchScript for faster inference
+    Falls back to tracing, then to the eager model, if scripting fails
+    """
+    try:
+        scripted = torch.jit.script(module)
+        logger.info("Compiled model with torch.jit.script")
+        return scripted
+    except Exception as e:
+        logger.warning(f"torch.jit.script failed, trying torch.jit.trace: {str(e)}")
+    
+    try:
+        example_input = torch.zeros(1, 50, dtype=torch.long)
+        traced = torch.jit.trace(module, example_input)
+        logger.info("Compiled model with torch.jit.trace")
+        return traced
+    except Exception as e:
+        logger.warning(f"torch.jit.trace failed, using eager model: {str(e)}")
+        return module
+
+def warmup_model(module, runs=2):
+    """
+    Run dummy forward passes so JIT specialization happens at startup
+    rather than on the first user request
+    """
+    dummy_input = torch.zeros(1, 50, dtype=torch.long)
+    for i in range(runs):
+        start = time.perf_counter()
+        try:
+            with torch.inference_mode(), torch.jit.optimized_execution(True):
+                module(dummy_input)
+        except Exception as e:
+            logger.warning(f"Warmup run {i + 1} failed: {str(e)}")
+            return
+        logger.info(f"Warmup run {i + 1} took {(time.perf_counter() - start) * 1000:.1f} ms")
+
+def postprocess_smiles(prediction):
+    """
+    Postprocess model prediction to generate SMILES string
+    This is a simplified version - you may need to adjust based on your model's output format
+    """
+    # This is a placeholder - you'll need to implement based on your model's actual output
+    # For now, return a mock SMILES string
+    # Use a simple fingerprint to select a consistent SMILES for the same input
+    if torch.is_tensor(prediction):
+        # The argmax is stable under ulp-level float differences (batching,
+        # thread count, INT8/ONNX) and avoids a Python float per element
+        hash_val = int(prediction.detach().reshape(-1).argmax())
+    else:
+        hash_val = zlib.crc32(str(prediction).encode('utf-8'))
+    index = hash_val % len(MOCK_SMILES)
+    
+    return MOCK_SMILES[index]
+
+def _predict_batch(tensors, batch_buffer):
+    """
+    Run stacked inputs through the model in one call
+    Returns batch-first predictions, or None (disabling batching for the loaded
+    model) if the model rejects the batch or returns a non batch-first output
+    """
+    global _batching_supported
+    try:
+        with torch.inference_mode(), torch.jit.optimized_execution(True):
+            batch = torch.cat(tensors, out=batch_buffer[:len(tensors)])
+            predictions = model(batch)
+    except Exception as e:
+        logger.warning(f"Batched prediction failed, running requests individually: {str(e)}")
+        _batching_supported = False
+        return None
+    
+    if not (torch.is_tensor(predictions) and predictions.dim() > 0 and predictions.shape[0] == len(tensors)):
+        logger.warning("Model output is not batch-first, running requests individually")
+        _batching_supported = False
+        return None
+    
+    return predictions
+
+def _batch_worker():
+    """
+    Collect queued inputs for up to BATCH_WINDOW_MS (or MAX_BATCH_SIZE items)
+    and run them through the model as a single batch
+    """
+    batch_buffer = torch.empty(MAX_BATCH_SIZE, 50, dtype=torch.long)
+    while True:
+        items = [_batch_queue.get()]
+        deadline = time.monotonic() + BATCH_WINDOW_MS / 1000
+        while len(items) < MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        tensors, futures = zip(*items)
+        if len(tensors) > 1 and _batching_supported:
+            predictions = _predict_batch(tensors, batch_buffer)
+            if predictions is not None:
+                for i, future in enumerate(futures):
+                    future.set_result(predictions[i:i + 1])
+                continue
+        
+        # Single item, or a model that does not support batching
+        for tensor, future in zip(tensors, futures):
+            try:
+                with torch.inference_mode(), torch.jit.optimized_execution(True):
+                    future.set_result(model(tensor))
+            except Exception as e:
+                future.set_exception(e)
+
+def run_model(input_tensor):
+    """
+    Run the model on a (1, 50) input, batching it with concurrent requests
+    """
+    global _batch_thread
+    # torch.compile recompiles for every new batch size, so batching is
+    # disabled rather than stalling requests on each new shape
+    if MAX_BATCH_SIZE <= 1 or TORCH_COMPILE:
+        with torch.inference_mode(), torch.jit.optimized_execution(True):
+            return model(input_tensor)
+    
+    # Started lazily so each forked gunicorn worker gets its own thread
+    with _batch_thread_lock:
+        if _batch_thread is None or not _batch_thread.is_alive():
+            _batch_thread = threading.Thread(target=_batch_worker, name='predict-batcher', daemon=True)
+            _batch_thread.start()
+    
+    future = Future()
+    _batch_queue.put((input_tensor, future))
+    return future.result(timeout=PREDICT_TIMEOUT_S)
+
+@lru_cache(maxsize=4096)
+def _predict_cached(sequence):
+    """
+    Predict SMILES for a validated, upper-cased protein sequence
+    Predictions are deterministic, so repeated sequences are served from cache
+    """
+    if not hasattr(model, '__call__'):
+        # It's a state dict, pick a mock SMILES directly from the sequence
+        logger.warning("Model is a state dict, using mock prediction")
+        return MOCK_SMILES[zlib.crc32(sequence.encode('ascii')) % len(MOCK_SMILES)]
+    
+    # Preprocess input
+    input_tensor = preprocess_protein_sequence(sequence)
+    
+    # Make prediction
+    prediction = run_model(input_tensor)
+    
+    # Postprocess output
+    smiles = postprocess_smiles(prediction)
+    
+    return smiles
+
+@predict_bp.route('/predict', methods=['POST'])
+def predict():
+    """Predict SMILES from protein sequence"""
+    try:
+        sequence, error = parse_sequence_request()
+        if error is not None:
+            return error
+        
+        if model is None:
+            return ojson({'error': 'Model not loaded'}, 500)
+        
+        smiles = _predict_cached(sequence)
+        
+        return ojson({
+            'smiles': smiles,
+            'sequence': sequence,
+            'status': 'success'
+        })
+        
+    except Exception as e:
+        logger.error(f"Prediction error: {str(e)}")
+        return ojson({'error': f'Prediction failed: {str(e)}'}, 500)
+
+def model_info():
+    """Get model information"""
+    if model is None:
+        return {'model_loaded': False}
+    
+    # Quantized models may have no float parameters left
+    param = next(model.parameters(), None) if hasattr(model, 'parameters') else None
+    
+    return {
+        'model_type': type(model).__name__,
+        'model_loaded': True,
+        'device': str(param.device) if param is not None else 'unknown'
+    }
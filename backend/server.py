@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Model server for protein analysis
+Serves SMILES prediction (/predict) and sequence generation (/generate)
+from a single Flask app via a REST API
+"""
+
+import torch
+import logging
+from flask import Flask
+from flask_cors import CORS
+import os
+import sys
+
+import generate
+import predict
+from common import ojson
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Small (1, 50) inputs run fastest without intra/inter-op thread contention
+torch.set_num_threads(int(os.environ.get('TORCH_THREADS', '1')))
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError as e:
+    logger.warning(f"Could not set inter-op threads: {str(e)}")
+
+app = Flask(__name__)
+CORS(app)  # Enable CORS for React frontend
+
+app.register_blueprint(predict.predict_bp)
+app.register_blueprint(generate.generate_bp)
+
+def load_models():
+    """
+    Load the prediction and generation models
+    Returns True if at least one of them loaded; each tool works independently
+    """
+    predict_ok = predict.model is not None or predict.load_model()
+    generate_ok = generate.model is not None or generate.load_model()
+    return predict_ok or generate_ok
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    predict_loaded = predict.model is not None
+    generate_loaded = generate.model is not None
+    return ojson({
+        'status': 'healthy',
+        'model_loaded': predict_loaded or generate_loaded,
+        'predict_loaded': predict_loaded,
+        'generate_loaded': generate_loaded
+    })
+
+@app.route('/model_info', methods=['GET'])
+def model_info():
+    """Get model information"""
+    if predict.model is None and generate.model is None:
+        return ojson({'error': 'Model not loaded'}, 500)
+    
+    return ojson({
+        'predict': predict.model_info(),
+        'generate': generate.model_info()
+    })
+
+# Load the models at import time so `gunicorn --preload` shares them across workers
+PRELOAD_MODEL = os.environ.get('PRELOAD_MODEL', '1') == '1'
+models_preloaded = PRELOAD_MODEL and load_models()
+
+def create_app():
+    """Load the models and return the app (entrypoint for WSGI servers)"""
+    # Don't retry (and re-log) checkpoints that already failed to preload
+    loaded = models_preloaded if PRELOAD_MODEL else load_models()
+    if not loaded:
+        raise RuntimeError("Failed to load any model")
+    return app
+
+if __name__ == '__main__':
+    # Load models on startup (already attempted at import when preloading)
+    if models_preloaded or (not PRELOAD_MODEL and load_models()):
+        from waitress import serve
+        logger.info("Starting model server...")
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        logger.error("Failed to load any model. Exiting.")
+        sys.exit(1)
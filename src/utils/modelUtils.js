@@ -8,7 +8,7 @@ const checkBackendHealth = async () => {
   try {
     const response = await fetch(`${API_BASE_URL}/health`);
     const data = await response.json();
-    return data.status === 'healthy' && data.model_loaded;
+    return data.status === 'healthy' && data.predict_loaded;
   } catch (error) {
     console.warn('Backend not available, using mock prediction:', error.message);
     return false;
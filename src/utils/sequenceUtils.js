@@ -1,14 +1,14 @@
 // Sequence generation utilities for protein sequence generation
 // This file handles the integration with the final_ckpt.pt model via backend API
 
-const API_BASE_URL = 'http://localhost:5001'; // Different port for sequence generation
+const API_BASE_URL = 'http://localhost:5000'; // Served by the same backend as SMILES prediction
 
 // Check if backend is available
 const checkBackendHealth = async () => {
   try {
     const response = await fetch(`${API_BASE_URL}/health`);
     const data = await response.json();
-    return data.status === 'healthy' && data.model_loaded;
+    return data.status === 'healthy' && data.generate_loaded;
   } catch (error) {
     console.warn('Sequence generation backend not available, using mock generation:', error.message);
     return false;
@@ -1,8 +1,8 @@
 @echo off
-echo Starting Protein to SMILES Predictor Backend...
+echo Starting Protein AI Tools Backend...
 echo.
-echo Make sure you have Python installed and the fusion_best.pt file in the root directory.
+echo Make sure you have Python installed and fusion_best.pt and/or final_ckpt.pt in the root directory.
 echo.
 cd backend
-python model_server.py
+python server.py
 pause